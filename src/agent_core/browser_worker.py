@@ -17,6 +17,8 @@ class BrowserWorker:
         self.dry_run = dry_run
         self.state_store = state_store
         self.event_tracer = event_tracer
+        # SHA-256 states primed with the constant "url::action::" fingerprint prefix.
+        self._hash_prefix: dict[tuple[str, str], Any] = {}
 
     def _extract_tasks(self) -> list[dict[str, Any]]:
         memory = self.state_store.get_memory("browser.tasks", default={"cursor": 0})
@@ -32,8 +34,14 @@ class BrowserWorker:
 
     def _queue_extracted_tasks(self, tasks: list[dict[str, Any]]) -> None:
         for task in tasks:
-            fingerprint = f"{task['target_url']}::{task['action']}::{task['cursor']}"
-            idempotency_key = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+            prefix_key = (task["target_url"], task["action"])
+            prefix = self._hash_prefix.get(prefix_key)
+            if prefix is None:
+                prefix = hashlib.sha256(f"{task['target_url']}::{task['action']}::".encode("utf-8"))
+                self._hash_prefix[prefix_key] = prefix
+            digest = prefix.copy()
+            digest.update(str(task["cursor"]).encode("utf-8"))
+            idempotency_key = digest.hexdigest()
             created = self.state_store.queue_action(
                 worker="browser",
                 action_type="browser_task",
@@ -64,10 +72,16 @@ class BrowserWorker:
 
         queued_actions = self.state_store.claim_actions(worker="browser", limit=10)
         LOGGER.info("BrowserWorker claimed %s action(s)", len(queued_actions))
-        for action in queued_actions:
-            try:
-                self._perform_action(action)
-                self.state_store.mark_action_status(action["id"], "done")
-            except Exception:
-                self.state_store.mark_action_status(action["id"], "failed")
-                raise
+        # Status updates are flushed in one batch at the end of the cycle, including on failure.
+        updates: list[tuple[int, str]] = []
+        try:
+            for action in queued_actions:
+                try:
+                    self._perform_action(action)
+                except Exception:
+                    updates.append((action["id"], "failed"))
+                    raise
+                updates.append((action["id"], "done"))
+        finally:
+            if updates:
+                self.state_store.mark_action_statuses(updates)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from typing import Any
 
 from agent_core.executor import ExecutionResult
 from agent_core.planner import PlannedTask
@@ -27,18 +28,21 @@ class Critic:
         issues: list[str] = []
         revisions: list[PlannedTask] = []
 
+        # Policy checks for all successful outputs run as one batch, then are consumed in result order.
+        output_texts = [self._output_text(result.output) for result in results if result.status == "ok"]
+        checked = iter(zip(output_texts, self.policy.evaluate_many(output_texts)))
+
         for result in results:
             if result.status != "ok":
                 issues.append(f"Task failed: {result.task.description} ({result.error})")
                 revisions.append(self._revision_task(result.task, reason="retry_failure"))
                 continue
 
-            output_text = " ".join(str(value) for value in result.output.values())
-            if len(output_text.strip()) < self.min_output_chars:
+            output_text, decision = next(checked)
+            if self._is_low_information(output_text):
                 issues.append(f"Low-information output for task: {result.task.description}")
                 revisions.append(self._revision_task(result.task, reason="expand_output"))
 
-            decision = self.policy.evaluate(output_text)
             if not decision.allowed:
                 reasons = ", ".join(decision.reasons)
                 issues.append(f"Risky output for task: {result.task.description} ({reasons})")
@@ -46,12 +50,22 @@ class Critic:
 
         return CritiqueReport(approved=not issues, issues=issues, revision_tasks=revisions)
 
+    @staticmethod
+    def _output_text(output: dict[str, Any]) -> str:
+        values = output.values()
+        try:
+            return " ".join(values)
+        except TypeError:
+            return " ".join(map(str, values))
+
+    def _is_low_information(self, text: str) -> bool:
+        if len(text) < self.min_output_chars:
+            return True
+        # Only pay for strip() when surrounding whitespace could push the length under the minimum.
+        if text[0].isspace() or text[-1].isspace():
+            return len(text.strip()) < self.min_output_chars
+        return False
+
     def _revision_task(self, task: PlannedTask, reason: str) -> PlannedTask:
-        metadata = dict(task.metadata)
-        metadata["revision_reason"] = reason
-        return PlannedTask(
-            description=f"Revise: {task.description}",
-            adapter_hint=task.adapter_hint,
-            priority=task.priority,
-            metadata=metadata,
-        )
+        metadata = task.metadata | {"revision_reason": reason} if task.metadata else {"revision_reason": reason}
+        return replace(task, description=f"Revise: {task.description}", metadata=metadata)
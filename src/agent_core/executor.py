@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+import inspect
+from typing import Any, Callable, Protocol
 
 from agent_core.planner import PlannedTask
 from agent_core.policy import PolicyEngine
@@ -11,7 +13,7 @@ from agent_core.policy import PolicyEngine
 
 class Adapter(Protocol):
     def execute(self, task: PlannedTask) -> dict[str, Any]:
-        """Run a task and return structured output."""
+        """Run a task and return structured output (``async`` adapters need ``Executor.run_async``)."""
 
 
 @dataclass(slots=True)
@@ -52,14 +54,24 @@ class Executor:
             "social": SocialAdapter(),
         }
         self.policy = policy or PolicyEngine()
+        # Adapters are fixed after construction, so resolve their bound execute methods once.
+        self._execute_by_name = {name: adapter.execute for name, adapter in self.adapters.items()}
+
+    def _resolve(self, task: PlannedTask) -> tuple[str, Callable[[PlannedTask], Any] | None]:
+        execute = self._execute_by_name.get(task.adapter_hint)
+        if execute is None:
+            return "terminal", self._execute_by_name.get("terminal")
+        return task.adapter_hint, execute
 
     def run(self, tasks: list[PlannedTask]) -> list[ExecutionResult]:
         results: list[ExecutionResult] = []
         for task in tasks:
-            adapter_name = task.adapter_hint if task.adapter_hint in self.adapters else "terminal"
+            adapter_name, execute = self._resolve(task)
             try:
                 self.policy.enforce_or_raise(task.description)
-                output = self.adapters[adapter_name].execute(task)
+                if execute is None:
+                    raise KeyError(adapter_name)
+                output = execute(task)
                 results.append(
                     ExecutionResult(
                         task=task,
@@ -78,3 +90,38 @@ class Executor:
                     )
                 )
         return results
+
+    async def run_async(self, tasks: list[PlannedTask], *, concurrency: int = 4) -> list[ExecutionResult]:
+        """Run tasks with at most `concurrency` in flight; results keep the input order."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _bounded(task: PlannedTask) -> ExecutionResult:
+            async with semaphore:
+                return await self._run_one_async(task)
+
+        return list(await asyncio.gather(*(_bounded(task) for task in tasks)))
+
+    async def _run_one_async(self, task: PlannedTask) -> ExecutionResult:
+        adapter_name, execute = self._resolve(task)
+        try:
+            self.policy.enforce_or_raise(task.description)
+            if execute is None:
+                raise KeyError(adapter_name)
+            if inspect.iscoroutinefunction(execute):
+                output = await execute(task)
+            else:
+                # Sync adapters may block on I/O, so run them off the event loop.
+                output = await asyncio.to_thread(execute, task)
+        except Exception as exc:
+            return ExecutionResult(
+                task=task,
+                adapter=adapter_name,
+                status="error",
+                error=str(exc),
+            )
+        return ExecutionResult(
+            task=task,
+            adapter=adapter_name,
+            status="ok",
+            output=output,
+        )
@@ -5,26 +5,28 @@ Starts immediately with safe defaults, no user prompts, and local-only workers.
 
 from __future__ import annotations
 
+import json
 import logging
 import signal
 import threading
 from pathlib import Path
-
-import json
+from typing import Any
 
 from agent_core.scheduler import Scheduler
 
 LOGGER = logging.getLogger("agent_core")
 
 
-def _read_log_level(config_path: Path) -> int:
+def _load_config(config_path: Path) -> dict[str, Any]:
     if not config_path.exists():
-        return logging.INFO
+        return {}
+
+    loaded: dict[str, Any] = json.loads(config_path.read_bytes())
+    return loaded
 
-    with config_path.open("r", encoding="utf-8") as config_file:
-        loaded = json.load(config_file)
 
-    configured_level = str(loaded.get("logging", {}).get("level", "INFO")).upper()
+def _read_log_level(config: dict[str, Any]) -> int:
+    configured_level = str(config.get("logging", {}).get("level", "INFO")).upper()
     return getattr(logging, configured_level, logging.INFO)
 
 
@@ -40,7 +42,8 @@ def configure_logging(level: int) -> None:
 def main() -> None:
     """Boot the scheduler immediately and wait for graceful shutdown signals."""
     config_path = Path("config/defaults.yaml")
-    configure_logging(_read_log_level(config_path))
+    config = _load_config(config_path)
+    configure_logging(_read_log_level(config))
 
     shutdown_event = threading.Event()
 
@@ -51,7 +54,7 @@ def main() -> None:
     signal.signal(signal.SIGINT, _handle_shutdown)
     signal.signal(signal.SIGTERM, _handle_shutdown)
 
-    scheduler = Scheduler(config_path=config_path, shutdown_event=shutdown_event)
+    scheduler = Scheduler(config_path=config_path, shutdown_event=shutdown_event, config=config)
 
     LOGGER.info("Starting agent_core with config: %s", config_path)
     scheduler.run()
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+from array import array
 from collections import deque
 from dataclasses import dataclass
-import hashlib
+import heapq
+from itertools import islice
 import json
 import math
+from operator import mul
 import sqlite3
+import threading
 import time
 from pathlib import Path
+from zlib import crc32
+
+# Bump when _embed changes so stored vectors are recomputed from their text on open.
+_EMBEDDING_VERSION = 2
+# Precomputed digest-byte -> [-1, 1] weights so embedding avoids per-token float math.
+_BYTE_WEIGHTS = tuple((value / 255.0) * 2 - 1 for value in range(256))
+# (key, text, metadata_json, embedding_blob, created_at) as fetched by LongTermMemory._SELECT_ALL_SQL.
+_IndexRow = tuple[str, str, str, bytes, float]
+
+# ASCII separators that str.split() honors but bytes.split() does not.
+_STR_ONLY_SEPARATORS = ("\x1c", "\x1d", "\x1e", "\x1f")
 
 
 @dataclass(slots=True)
@@ -20,6 +35,11 @@ class MemoryEntry:
     created_at: float
 
 
+def _pack_embedding(embedding: list[float]) -> bytes:
+    """Serialize an embedding as native float32 bytes for the BLOB column."""
+    return array("f", embedding).tobytes()
+
+
 class ShortTermMemory:
     """Bounded in-process context window."""
 
@@ -39,90 +59,154 @@ class ShortTermMemory:
     def recent(self, limit: int = 10) -> list[MemoryEntry]:
         if limit <= 0:
             return []
-        return list(self._items)[-limit:]
+        # Walk only the newest `limit` items instead of copying the whole deque.
+        recent = list(islice(reversed(self._items), limit))
+        recent.reverse()
+        return recent
 
 
 class LongTermMemory:
     """SQLite + deterministic hashed-vector index for retrieval."""
 
+    _UPSERT_SQL = """
+        INSERT INTO long_term_memory (key, text, metadata_json, embedding_blob, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            text=excluded.text,
+            metadata_json=excluded.metadata_json,
+            embedding_blob=excluded.embedding_blob,
+            created_at=excluded.created_at
+    """
+    _SELECT_ALL_SQL = "SELECT key, text, metadata_json, embedding_blob, created_at FROM long_term_memory"
+
     def __init__(self, db_path: Path | str = "data/agent_memory.sqlite3") -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived autocommit connection shared by all calls; the lock serializes access to it
+        # and to the embedding matrix + rows cached in-process (rebuilt lazily after writes).
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._matrix: array | None = None
+        self._rows: list[_IndexRow] = []
+        # PRAGMA data_version when the index was built; it moves when any other connection commits.
+        self._index_version = -1
         self._initialize()
 
     def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.db_path)
-        connection.row_factory = sqlite3.Row
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA mmap_size=268435456")
         return connection
 
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> LongTermMemory:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
     def _initialize(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS long_term_memory (
-                    key TEXT PRIMARY KEY,
-                    text TEXT NOT NULL,
-                    metadata_json TEXT NOT NULL,
-                    embedding_json TEXT NOT NULL,
-                    created_at REAL NOT NULL
-                );
-                """
-            )
+        conn = self._conn
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(long_term_memory)")}
+                if "embedding_json" in columns:
+                    conn.execute("ALTER TABLE long_term_memory RENAME TO long_term_memory_legacy")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS long_term_memory (
+                        key TEXT PRIMARY KEY,
+                        text TEXT NOT NULL,
+                        metadata_json TEXT NOT NULL,
+                        embedding_blob BLOB NOT NULL,
+                        created_at REAL NOT NULL
+                    )
+                    """
+                )
+                if "embedding_json" in columns:
+                    conn.execute(
+                        """
+                        INSERT INTO long_term_memory (key, text, metadata_json, embedding_blob, created_at)
+                        SELECT key, text, metadata_json, X'', created_at FROM long_term_memory_legacy
+                        """
+                    )
+                    conn.execute("DROP TABLE long_term_memory_legacy")
+                if conn.execute("PRAGMA user_version").fetchone()[0] < _EMBEDDING_VERSION:
+                    self._reembed_rows(conn)
+                    conn.execute(f"PRAGMA user_version = {_EMBEDDING_VERSION}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _reembed_rows(self, conn: sqlite3.Connection) -> None:
+        """Recompute stored vectors from their text after the embedding scheme changes."""
+        rows = conn.execute("SELECT key, text FROM long_term_memory").fetchall()
+        conn.executemany(
+            "UPDATE long_term_memory SET embedding_blob = ? WHERE key = ?",
+            [(_pack_embedding(self._embed(text)), key) for key, text in rows],
+        )
 
     def store(self, key: str, text: str, metadata: dict[str, str] | None = None) -> None:
         embedding = self._embed(text)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO long_term_memory (key, text, metadata_json, embedding_json, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET
-                    text=excluded.text,
-                    metadata_json=excluded.metadata_json,
-                    embedding_json=excluded.embedding_json,
-                    created_at=excluded.created_at
-                """,
-                (key, text, json.dumps(metadata or {}, sort_keys=True), json.dumps(embedding), time.time()),
-            )
+        metadata_json = json.dumps(metadata or {}, separators=(",", ":"))
+        params = (key, text, metadata_json, _pack_embedding(embedding), time.time())
+        with self._lock:
+            self._conn.execute(self._UPSERT_SQL, params)
+            self._matrix = None
 
     def query(self, text: str, limit: int = 5) -> list[MemoryEntry]:
         target = self._embed(text)
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT key, text, metadata_json, embedding_json, created_at FROM long_term_memory"
-            ).fetchall()
-
-        scored: list[tuple[float, MemoryEntry]] = []
-        for row in rows:
-            emb = json.loads(str(row["embedding_json"]))
-            score = self._cosine(target, emb)
-            scored.append(
-                (
-                    score,
-                    MemoryEntry(
-                        key=str(row["key"]),
-                        text=str(row["text"]),
-                        metadata=json.loads(str(row["metadata_json"])),
-                        created_at=float(row["created_at"]),
-                    ),
-                )
+        matrix, rows = self._load_index()
+        if not rows:
+            return []
+
+        # Score every row against one contiguous float32 matrix, then materialize only the top-k.
+        dims = len(target)
+        scores = [sum(map(mul, target, matrix[offset : offset + dims])) for offset in range(0, len(matrix), dims)]
+        top = heapq.nlargest(max(1, limit), range(len(rows)), key=scores.__getitem__)
+        entries: list[MemoryEntry] = []
+        for idx in top:
+            key, entry_text, metadata_json, _embedding_blob, created_at = rows[idx]
+            entries.append(
+                MemoryEntry(key=key, text=entry_text, metadata=json.loads(metadata_json), created_at=created_at)
             )
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return [entry for _score, entry in scored[: max(1, limit)]]
+        return entries
+
+    def _load_index(self) -> tuple[array, list[_IndexRow]]:
+        with self._lock:
+            # store() clears _matrix for this connection's writes; data_version catches the rest.
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._matrix is None or version != self._index_version:
+                self._rows = self._conn.execute(self._SELECT_ALL_SQL).fetchall()
+                self._matrix = array("f", b"".join([row[3] for row in self._rows]))
+                self._index_version = version
+            return self._matrix, self._rows
+
+    @staticmethod
+    def _tokenize(text: str) -> list[bytes]:
+        # ASCII text is lowered and split as one bytes buffer, yielding the same tokens as the
+        # str path without a per-token encode. bytes.split() does not treat \x1c-\x1f as
+        # whitespace while str.split() does, so text containing them keeps the str path.
+        if text.isascii() and not any(sep in text for sep in _STR_ONLY_SEPARATORS):
+            return text.encode("ascii").lower().split()
+        return [token.encode("utf-8") for token in text.lower().split()]
 
     def _embed(self, text: str, dims: int = 16) -> list[float]:
+        # Buckets only need a stable, well-mixed hash; CRC-32 is not cryptographic and need not be.
         vector = [0.0] * dims
-        for token in text.lower().split():
-            digest = hashlib.sha256(token.encode("utf-8")).digest()
-            idx = digest[0] % dims
-            value = (digest[1] / 255.0) * 2 - 1
-            vector[idx] += value
-        norm = math.sqrt(sum(component * component for component in vector)) or 1.0
+        for token in self._tokenize(text):
+            digest = crc32(token)
+            vector[digest % dims] += _BYTE_WEIGHTS[(digest >> 8) & 0xFF]
+        norm = math.hypot(*vector) or 1.0
         return [component / norm for component in vector]
 
-    def _cosine(self, left: list[float], right: list[float]) -> float:
-        return sum(a * b for a, b in zip(left, right))
-
 
 class MemoryManager:
     """Unified memory facade."""
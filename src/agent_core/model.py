@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 import logging
 from typing import Sequence
@@ -61,6 +62,10 @@ class ContextBudgetManager:
     max_context_tokens: int = 2048
     reserve_tokens: int = 256
 
+    # Upper bound on head rewrites when replaying the historical loop; it reaches a fixed point far
+    # sooner for the deterministic summary, this only guards against a summarizer that never repeats.
+    _HEAD_REWRITE_LIMIT = 64
+
     def _estimate_tokens(self, text: str) -> int:
         # Cheap deterministic approximation for local-only environments.
         return max(1, len(text) // 4)
@@ -77,17 +82,55 @@ class ContextBudgetManager:
 
         budget = max(128, self.max_context_tokens - self.reserve_tokens)
         result = list(messages)
-        while result and sum(self._estimate_tokens(item) for item in result) > budget:
-            if len(result) == 1:
-                result[0] = self._summarize_text(result[0], summarizer)
+        sizes = [self._estimate_tokens(item) for item in result]
+        total = sum(sizes)
+        if total <= budget:
+            return result
+        if len(result) == 1:
+            result[0] = self._summarize_text(result[0], summarizer)
+            return result
+
+        # Historical behavior: only the oldest message is rewritten, re-summarized and wrapped as
+        # "Summary: ..."[:220] until the list fits. The rest of the list never changes, so that loop
+        # is replayed against a fixed remainder. A head that repeats (or runs past the cap) means the
+        # historical loop would never have finished; only then use the summarize-and-merge path below.
+        remainder = total - sizes[0]
+        head = result[0]
+        seen: set[str] = set()
+        while self._estimate_tokens(head) + remainder > budget:
+            if head in seen or len(seen) >= self._HEAD_REWRITE_LIMIT:
                 break
-            oldest = result.pop(0)
-            summary = self._summarize_text(oldest, summarizer)
-            result.insert(0, summary)
-            if len(result) > 1:
-                # collapse repeated summaries if still over budget
-                result[0] = f"Summary: {result[0][:220]}"
-        return result
+            seen.add(head)
+            head = f"Summary: {self._summarize_text(head, summarizer)[:220]}"
+        else:
+            result[0] = head
+            return result
+
+        # Summarize oldest messages first, adjusting a running total instead of re-summing the list.
+        index = 0
+        while total > budget and index < len(result):
+            summary = self._summarize_text(result[index], summarizer)
+            summary_size = self._estimate_tokens(summary)
+            total += summary_size - sizes[index]
+            result[index] = summary
+            sizes[index] = summary_size
+            index += 1
+
+        if total <= budget:
+            return result
+
+        # Still over budget with every message summarized: collapse the oldest summaries pairwise.
+        pending = deque(result)
+        pending_sizes = deque(sizes)
+        while total > budget and len(pending) > 1:
+            combined = f"{pending.popleft()} {pending.popleft()}"
+            total -= pending_sizes.popleft() + pending_sizes.popleft()
+            merged = f"Summary: {combined[:220]}"
+            merged_size = self._estimate_tokens(merged)
+            pending.appendleft(merged)
+            pending_sizes.appendleft(merged_size)
+            total += merged_size
+        return list(pending)
 
     def _summarize_text(self, text: str, summarizer: "LocalModel | None") -> str:
         if summarizer is None:
@@ -6,13 +6,23 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import json
 import logging
+import os
 from pathlib import Path
 import random
+import re
+import threading
 import time
 from typing import Any, Callable
 
 LOGGER = logging.getLogger("agent_core.platforms.base")
 
+# Compiled once at import so each safety check is a single regex sweep over the draft.
+_BLOCKED_RE = re.compile(r"password|api key|credit card|social security|https?://", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"TODO|TBD")
+# Typical drafts are short enough that lowering once and scanning for these beats the regex.
+_SHORT_MARKERS = ("password", "api key", "credit card", "social security", "http://", "https://")
+_SHORT_CONTENT_LIMIT = 64
+
 
 @dataclass(slots=True)
 class PlatformCapabilities:
@@ -47,22 +57,80 @@ class SafetyDecision:
 class SessionStore:
     """Persistent on-disk session/cookie store."""
 
-    def __init__(self, platform_name: str, base_dir: Path = Path("data/sessions")) -> None:
+    # Session directories already created in this process; guarded by _dirs_lock. Keyed by the
+    # absolute path (no filesystem access, unlike resolve()) so a relative base_dir is created again
+    # after the working directory changes.
+    _initialized_dirs: set[str] = set()
+    _dirs_lock = threading.Lock()
+
+    def __init__(self, platform_name: str, base_dir: Path = Path("data/sessions"), fsync: bool = True) -> None:
         self.platform_name = platform_name
+        self.fsync = fsync
         self.base_dir = base_dir
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+        absolute_dir = os.path.abspath(base_dir)
+        with SessionStore._dirs_lock:
+            if absolute_dir not in SessionStore._initialized_dirs:
+                base_dir.mkdir(parents=True, exist_ok=True)
+                SessionStore._initialized_dirs.add(absolute_dir)
         self.path = self.base_dir / f"{platform_name}.json"
+        # Parsed session keyed by the file's (mtime_ns, size); reparsed only when the file changes.
+        self._cached: dict[str, Any] = {}
+        self._cached_sig: tuple[int, int] | None = None
+        # Payload staged by mark_dirty() and persisted by the next flush().
+        self._pending: dict[str, Any] | None = None
+        self._pending_fsync: bool | None = None
 
     def load(self) -> dict[str, Any]:
-        if not self.path.exists():
+        """Return the session payload; the result is shared between calls, so treat it as read-only."""
+        if self._pending is not None:
+            return self._pending
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
             return {}
 
-        with self.path.open("r", encoding="utf-8") as session_file:
-            return json.load(session_file)
-
-    def save(self, payload: dict[str, Any]) -> None:
-        with self.path.open("w", encoding="utf-8") as session_file:
-            json.dump(payload, session_file, indent=2, sort_keys=True)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._cached_sig:
+            self._cached = json.loads(self.path.read_bytes())
+            self._cached_sig = signature
+        return self._cached
+
+    def signature(self) -> tuple[int, int] | None:
+        """Return the session file's (mtime_ns, size), or None when it does not exist yet."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def mark_dirty(self, payload: dict[str, Any], *, fsync: bool | None = None) -> None:
+        """Stage a payload in memory; it is written on the next flush()."""
+        self._pending = payload
+        self._pending_fsync = fsync
+
+    def flush(self) -> None:
+        """Persist the staged payload, if any, with a single save()."""
+        if self._pending is not None:
+            self.save(self._pending, fsync=self._pending_fsync)
+
+    def save(self, payload: dict[str, Any], *, fsync: bool | None = None) -> None:
+        self._pending = None
+        data = json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+        try:
+            if self.path.read_bytes() == data:
+                return
+        except FileNotFoundError:
+            pass
+
+        # Write to a sibling temp file and swap it in so readers never see a torn session file.
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with tmp_path.open("wb", buffering=1 << 16) as session_file:
+            session_file.write(data)
+            session_file.flush()
+            if self.fsync if fsync is None else fsync:
+                os.fsync(session_file.fileno())
+        os.replace(tmp_path, self.path)
+        self._cached_sig = None
 
     def load_or_initialize(self) -> dict[str, Any]:
         existing = self.load()
@@ -73,9 +141,13 @@ class SessionStore:
             "authenticated": False,
             "cookies": {},
             "notes": "Set authenticated=true after completing platform login/MFA/CAPTCHA manually.",
-            "updated_at": time.time(),
+            # Fixed rather than time.time() so an unchanged bootstrap re-serializes byte-identically and
+            # save() can skip the write; it becomes meaningful once the session is re-saved after login.
+            "updated_at": 0,
         }
-        self.save(bootstrap)
+        # The bootstrap stub is trivially regenerated, so it does not need to be fsync'd. It is only
+        # staged here; the adapter flushes its session store after login and at the end of each cycle.
+        self.mark_dirty(bootstrap, fsync=False)
         return bootstrap
 
 
@@ -86,43 +158,72 @@ class ContentSafetyPolicy:
         if content is None:
             return SafetyDecision(False, "Blocked: draft returned no content.")
 
-        body = content.strip()
-        if not body:
+        # Checks run on the raw draft; markers never contain surrounding whitespace, so only the
+        # rare over-length draft pays for a stripped copy.
+        if not content or content.isspace():
             return SafetyDecision(False, "Blocked: empty content.")
 
-        if len(body) > 500:
+        if len(content) > 500 and len(content.strip()) > 500:
             return SafetyDecision(False, "Blocked: content exceeds conservative 500-char limit.")
 
-        lowered = body.lower()
-        blocked_markers = ["password", "api key", "credit card", "social security"]
-        for marker in blocked_markers:
-            if marker in lowered:
-                return SafetyDecision(False, f"Blocked: possible sensitive data marker '{marker}'.")
-
-        if "http://" in lowered or "https://" in lowered:
-            return SafetyDecision(False, "Blocked: external links require manual review.")
-
-        if "TODO" in content or "TBD" in content:
+        if len(content) < _SHORT_CONTENT_LIMIT:
+            lowered = content.lower()
+            for marker in _SHORT_MARKERS:
+                if marker in lowered:
+                    break
+            else:
+                if "TODO" in content or "TBD" in content:
+                    return SafetyDecision(False, "Blocked: uncertain draft placeholder detected.")
+                return SafetyDecision(True, "Allowed")
+
+        # Also reached on a short-path hit, so the reported marker is the earliest one in the draft.
+        blocked = _BLOCKED_RE.search(content)
+        if blocked:
+            marker = blocked.group(0).lower()
+            if marker.endswith("://"):
+                return SafetyDecision(False, "Blocked: external links require manual review.")
+            return SafetyDecision(False, f"Blocked: possible sensitive data marker '{marker}'.")
+
+        if _PLACEHOLDER_RE.search(content):
             return SafetyDecision(False, "Blocked: uncertain draft placeholder detected.")
 
         return SafetyDecision(True, "Allowed")
 
 
+class _ShutdownRequested(Exception):
+    """Raised inside an adapter cycle when the scheduler's shutdown event fires during a wait."""
+
+
 class PlatformAdapter(ABC):
     """Shared interface and safety controls for platform adapters."""
 
+    # True when draft_response ignores its context (a constant or None), so drafting does no real work.
+    _is_static_draft: bool = False
+
     def __init__(
         self,
         platform_name: str,
         capabilities: PlatformCapabilities,
         rate_limit_policy: RateLimitPolicy,
+        shutdown_event: threading.Event | None = None,
     ) -> None:
         self.platform_name = platform_name
         self.capabilities = capabilities
         self.rate_limit_policy = rate_limit_policy
         self.session_store = SessionStore(platform_name)
         self.safety_policy = ContentSafetyPolicy()
-        self._last_action_at: float = 0.0
+        # perf_counter's origin is arbitrary, so "never acted" must compare as infinitely long ago.
+        self._last_action_at: float = float("-inf")
+        # Set by the scheduler so rate-limit and backoff waits end as soon as shutdown starts.
+        self.shutdown_event = shutdown_event
+        # Per-adapter generator (no shared module-level Random state) and pre-unpacked jitter bounds.
+        self._rng = random.Random()
+        self._jitter_lo, self._jitter_hi = rate_limit_policy.jitter_seconds
+        # Set by the scheduler to its longest cycle period, so a login result can carry over to the
+        # next cycle; None (no scheduler) disables the cache.
+        self.login_cache_seconds: float | None = None
+        # (perf_counter time, session file signature, result) of the last login attempt.
+        self._login_cache: tuple[float, tuple[int, int] | None, bool] | None = None
 
     @abstractmethod
     def login(self, session_store: SessionStore) -> bool:
@@ -144,55 +245,110 @@ class PlatformAdapter(ABC):
     def health_check(self) -> bool:
         """Run platform-specific health checks before any action."""
 
+    def _sleep(self, seconds: float) -> None:
+        if self.shutdown_event is None:
+            time.sleep(seconds)
+        elif self.shutdown_event.wait(timeout=seconds):
+            raise _ShutdownRequested()
+
     def _apply_rate_limit(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_action_at
-        min_wait = max(self.rate_limit_policy.min_interval_seconds - elapsed, 0.0)
-        jitter = random.uniform(*self.rate_limit_policy.jitter_seconds)
-        wait_for = min_wait + jitter
-        if wait_for > 0:
-            LOGGER.info("[%s] Rate limiting: sleeping %.2fs", self.platform_name, wait_for)
-            time.sleep(wait_for)
-        self._last_action_at = time.monotonic()
+        now = time.perf_counter()
+        deficit = self.rate_limit_policy.min_interval_seconds - (now - self._last_action_at)
+        if deficit <= 0.0:
+            # The interval has already passed; no jitter draw, log, or sleep needed.
+            self._last_action_at = now
+            return
+        wait_for = deficit + self._rng.uniform(self._jitter_lo, self._jitter_hi)
+        LOGGER.debug("[%s] Rate limiting: sleeping %.2fs", self.platform_name, wait_for)
+        self._sleep(wait_for)
+        self._last_action_at = time.perf_counter()
 
     def _with_retry(self, action_name: str, action: Callable[[], Any]) -> Any:
         attempt = 0
+        policy = self.rate_limit_policy
+        # Decorrelated jitter: each backoff is drawn from [base, 3 * previous], capped, so concurrent
+        # retries against the same upstream spread out instead of synchronizing.
+        backoff = policy.backoff_base_seconds
+        paced = False
         while True:
-            self._apply_rate_limit()
+            # After a failure the backoff sleep below already covered the pacing interval.
+            if not paced:
+                self._apply_rate_limit()
+            paced = False
             try:
                 return action()
             except Exception as exc:
                 attempt += 1
-                if attempt > self.rate_limit_policy.max_retries:
+                if attempt > policy.max_retries:
                     LOGGER.error("[%s] %s failed after %s retries: %s", self.platform_name, action_name, attempt - 1, exc)
                     raise
 
                 backoff = min(
-                    self.rate_limit_policy.backoff_base_seconds * (2 ** (attempt - 1)),
-                    self.rate_limit_policy.max_backoff_seconds,
+                    policy.max_backoff_seconds,
+                    self._rng.uniform(policy.backoff_base_seconds, backoff * 3.0),
                 )
-                backoff += random.uniform(*self.rate_limit_policy.jitter_seconds)
+                # One sleep covers both the backoff and whatever remains of the rate-limit interval.
+                deficit = policy.min_interval_seconds - (time.perf_counter() - self._last_action_at)
+                wait_for = max(backoff, deficit)
                 LOGGER.warning(
                     "[%s] %s failed (attempt %s/%s): %s. Backing off %.2fs",
                     self.platform_name,
                     action_name,
                     attempt,
-                    self.rate_limit_policy.max_retries,
+                    policy.max_retries,
                     exc,
-                    backoff,
+                    wait_for,
                 )
-                time.sleep(backoff)
+                self._sleep(wait_for)
+                self._last_action_at = time.perf_counter()
+                paced = True
 
     def process_cycle(self, config: dict[str, Any], dry_run: bool = True) -> None:
         """Default process cycle using shared safeguards and capability gating."""
+        try:
+            self._run_cycle(config, dry_run)
+        except _ShutdownRequested:
+            LOGGER.info("[%s] Shutdown requested; abandoning platform cycle", self.platform_name)
+        finally:
+            # Session writes staged during the cycle are persisted once, however the cycle ended.
+            self.session_store.flush()
+
+    def _authenticate(self) -> bool:
+        # Reuse the previous cycle's login result while the session file is unchanged; it cannot
+        # differ yet. The rate-limit interval is added as slack for drift in when login runs.
+        signature = self.session_store.signature()
+        cached = self._login_cache
+        ttl = self.login_cache_seconds
+        if (
+            cached is not None
+            and ttl is not None
+            and cached[1] == signature
+            and time.perf_counter() - cached[0] < ttl + self.rate_limit_policy.min_interval_seconds
+        ):
+            return cached[2]
+        authenticated = self._with_retry("login", lambda: self.login(self.session_store))
+        # Land any bootstrap stub login staged, so the cached signature matches the file on disk.
+        self.session_store.flush()
+        self._login_cache = (time.perf_counter(), self.session_store.signature(), authenticated)
+        return authenticated
+
+    def _run_cycle(self, config: dict[str, Any], dry_run: bool) -> None:
+        capabilities = self.capabilities
+        if not (
+            capabilities.can_fetch_feed
+            or (capabilities.can_draft_response and not self._is_static_draft)
+            or capabilities.can_post
+        ):
+            LOGGER.debug("[%s] No actionable capabilities; skipping platform cycle", self.platform_name)
+            return
+
         LOGGER.info("[%s] Starting platform cycle", self.platform_name)
         if not self.health_check():
             LOGGER.error("[%s] Health check failed; failing closed.", self.platform_name)
             return
 
         if self.capabilities.can_login:
-            authenticated = self._with_retry("login", lambda: self.login(self.session_store))
-            if not authenticated:
+            if not self._authenticate():
                 LOGGER.error("[%s] Not authenticated. Manual setup required; failing closed.", self.platform_name)
                 return
 
@@ -224,3 +380,55 @@ class PlatformAdapter(ABC):
 
         self._with_retry("post", lambda: self.post(draft))
         LOGGER.info("[%s] Post completed", self.platform_name)
+
+
+class StaticPlatformAdapter(PlatformAdapter):
+    """Adapter whose feed, drafts, and posting behavior are declared as data rather than methods.
+
+    Drafts are `"{draft_prefix}: {first feed item text}"`; with no feed (or no prefix) the
+    `fallback_draft` is used. Posts are only simulated when `simulate_posts` is set.
+    """
+
+    def __init__(
+        self,
+        platform_name: str,
+        capabilities: PlatformCapabilities,
+        rate_limit_policy: RateLimitPolicy,
+        *,
+        feed: tuple[dict[str, Any], ...] = (),
+        draft_prefix: str | None = None,
+        fallback_draft: str | None = None,
+        simulate_posts: bool = False,
+    ) -> None:
+        super().__init__(platform_name, capabilities, rate_limit_policy)
+        self._feed = feed
+        self._draft_prefix = draft_prefix
+        self._fallback_draft = fallback_draft
+        self._simulate_posts = simulate_posts
+        self._is_static_draft = draft_prefix is None
+        self._logger = logging.getLogger(f"agent_core.platforms.{platform_name}")
+
+    def login(self, session_store: SessionStore) -> bool:
+        session = session_store.load_or_initialize()
+        if not session.get("authenticated", False):
+            self._logger.warning("[%s] Session not initialized at %s", self.platform_name, session_store.path)
+            return False
+        return True
+
+    def fetch_feed(self) -> list[dict[str, Any]]:
+        return [dict(item) for item in self._feed]
+
+    def draft_response(self, context: list[dict[str, Any]]) -> str | None:
+        if self._draft_prefix is None or not context:
+            return self._fallback_draft
+        return f"{self._draft_prefix}: {context[0]['text']}"
+
+    def post(self, content: str) -> bool:
+        if self._simulate_posts:
+            self._logger.info("[%s] Simulated post: %s", self.platform_name, content)
+            return True
+        self._logger.info("[%s] Posting disabled by capability matrix", self.platform_name)
+        return False
+
+    def health_check(self) -> bool:
+        return True
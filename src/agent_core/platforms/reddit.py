@@ -2,14 +2,10 @@
 
 from __future__ import annotations
 
-import logging
+from agent_core.platforms.base import PlatformCapabilities, RateLimitPolicy, StaticPlatformAdapter
 
-from agent_core.platforms.base import PlatformAdapter, PlatformCapabilities, RateLimitPolicy, SessionStore
 
-LOGGER = logging.getLogger("agent_core.platforms.reddit")
-
-
-class RedditAdapter(PlatformAdapter):
+class RedditAdapter(StaticPlatformAdapter):
     def __init__(self) -> None:
         super().__init__(
             platform_name="reddit",
@@ -21,26 +17,8 @@ class RedditAdapter(PlatformAdapter):
                 notes="Subreddit rules and moderator policies can prohibit automation.",
             ),
             rate_limit_policy=RateLimitPolicy(min_interval_seconds=10, jitter_seconds=(0.6, 2.5), max_retries=4),
+            feed=({"id": "thread-1", "text": "How do you handle retries safely?"},),
+            draft_prefix="Draft comment",
+            fallback_draft="Drafting paused until a moderated topic is selected.",
+            simulate_posts=True,
         )
-
-    def login(self, session_store: SessionStore) -> bool:
-        session = session_store.load_or_initialize()
-        if not session.get("authenticated", False):
-            LOGGER.warning("[reddit] Session not initialized at %s", session_store.path)
-            return False
-        return True
-
-    def fetch_feed(self) -> list[dict[str, str]]:
-        return [{"id": "thread-1", "text": "How do you handle retries safely?"}]
-
-    def draft_response(self, context: list[dict[str, str]]) -> str | None:
-        if not context:
-            return "Drafting paused until a moderated topic is selected."
-        return f"Draft comment: {context[0]['text']}"
-
-    def post(self, content: str) -> bool:
-        LOGGER.info("[reddit] Simulated post: %s", content)
-        return True
-
-    def health_check(self) -> bool:
-        return True
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import re
+from typing import Sequence
 
 
 @dataclass(slots=True)
@@ -12,7 +14,7 @@ class PolicyDecision:
 
 
 class PolicyEngine:
-    """Stateless guardrail engine."""
+    """Guardrail engine with a memo of decisions for recently seen texts."""
 
     PROHIBITED_TERMS = {
         "exfiltrate",
@@ -22,14 +24,47 @@ class PolicyEngine:
         "ransomware",
         "self-replicate",
     }
+    _CACHE_MAX_ENTRIES = 4096
+
+    def __init__(self) -> None:
+        # Bump `version` whenever the rules change so memoized decisions are no longer hit.
+        self.version = 0
+        self._cache: dict[tuple[int, str], PolicyDecision] = {}
+        # One case-insensitive alternation rejects clean texts without lowercasing them or scanning
+        # once per term. Compiled from the instance attribute so subclasses can override PROHIBITED_TERMS.
+        self._prohibited_re = re.compile(
+            "|".join(re.escape(term) for term in sorted(self.PROHIBITED_TERMS)),
+            re.IGNORECASE,
+        )
 
     def evaluate(self, text: str) -> PolicyDecision:
-        lowered = text.lower()
-        reasons = [term for term in self.PROHIBITED_TERMS if term in lowered]
-        return PolicyDecision(allowed=not reasons, reasons=reasons)
+        return self.evaluate_many([text])[0]
+
+    def evaluate_many(self, texts: Sequence[str]) -> list[PolicyDecision]:
+        """Evaluate a batch of texts with one shared precompiled matcher."""
+        search = self._prohibited_re.search
+        cache = self._cache
+        version = self.version
+        decisions: list[PolicyDecision] = []
+        for text in texts:
+            key = (version, text)
+            decision = cache.get(key)
+            if decision is None:
+                reasons: list[str] = []
+                if search(text) is not None:
+                    # Matches do not overlap and may differ from the term by case folding, so the
+                    # reported terms come from the canonical list.
+                    lowered = text.lower()
+                    reasons = sorted(term for term in self.PROHIBITED_TERMS if term in lowered)
+                decision = PolicyDecision(allowed=not reasons, reasons=reasons)
+                if len(cache) >= self._CACHE_MAX_ENTRIES:
+                    cache.clear()
+                cache[key] = decision
+            decisions.append(decision)
+        return decisions
 
     def enforce_or_raise(self, text: str) -> None:
         decision = self.evaluate(text)
         if not decision.allowed:
-            blocked = ", ".join(sorted(decision.reasons))
+            blocked = ", ".join(decision.reasons)
             raise ValueError(f"Policy violation: contains prohibited term(s): {blocked}")
@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
 import random
 import sqlite3
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from agent_core.browser_worker import BrowserWorker
 from agent_core.platforms import PLATFORM_ADAPTERS
+from agent_core.platforms.base import PlatformAdapter
 from agent_core.terminal_worker import TerminalWorker
 
 LOGGER = logging.getLogger("agent_core.scheduler")
@@ -33,80 +35,232 @@ class SchedulerConfig:
 
 
 class EventTracer:
-    """Writes structured event traces as JSONL."""
+    """Writes structured event traces as JSONL from a single background writer thread."""
+
+    # The writer coalesces up to this many events, or whatever arrives within the flush interval,
+    # into one write. Once the queue bound is hit, new events are dropped (and counted) rather than
+    # blocking the emitting worker.
+    _BATCH_MAX_EVENTS = 64
+    _FLUSH_INTERVAL_SECONDS = 0.05
+    _QUEUE_MAX_EVENTS = 10_000
+    _CLOSE_TIMEOUT_SECONDS = 5.0
 
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
-
-    def emit(self, event_type: str, **payload: Any) -> None:
+        self._queue: queue.Queue[tuple[float, str, dict[str, Any]] | None] = queue.Queue(
+            maxsize=self._QUEUE_MAX_EVENTS
+        )
+        # Orders emit() against close(), so every accepted event is queued ahead of the stop marker.
+        self._state_lock = threading.Lock()
+        self._closed = False
+        self.dropped_events = 0
+        self._writer = threading.Thread(target=self._drain, name="event-tracer", daemon=True)
+        self._writer.start()
+
+    def emit(self, event_type: str, *, ts: float | None = None, **payload: Any) -> None:
+        """Queue an event for the writer thread; events emitted after close() are dropped.
+
+        `ts` lets callers that already hold a wall-clock reading reuse it instead of a fresh time.time().
+        """
+        with self._state_lock:
+            if self._closed:
+                return
+            try:
+                self._queue.put_nowait((time.time() if ts is None else ts, event_type, payload))
+            except queue.Full:
+                self.dropped_events += 1
+
+    def close(self) -> None:
+        """Write out queued events and stop the writer thread, waiting at most a few seconds."""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._queue.put(None, timeout=self._CLOSE_TIMEOUT_SECONDS)
+        except queue.Full:
+            LOGGER.error("Trace writer for %s is not draining; abandoning queued events", self.path)
+            return
+        self._writer.join(timeout=self._CLOSE_TIMEOUT_SECONDS)
+        if self._writer.is_alive():
+            LOGGER.error("Trace writer for %s did not finish within %ss", self.path, self._CLOSE_TIMEOUT_SECONDS)
+        if self.dropped_events:
+            LOGGER.warning("Dropped %s trace event(s) because the writer queue was full", self.dropped_events)
+
+    def _format(self, item: tuple[float, str, dict[str, Any]]) -> str:
+        ts, event_type, payload = item
         record = {
-            "ts": time.time(),
+            "ts": ts,
             "event": event_type,
             **payload,
         }
-        line = json.dumps(record, sort_keys=True)
-        with self._lock:
-            with self.path.open("a", encoding="utf-8") as event_file:
-                event_file.write(f"{line}\n")
+        try:
+            return json.dumps(record, sort_keys=True) + "\n"
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("Dropping unserializable trace event '%s'", event_type)
+            return ""
+
+    def _drain(self) -> None:
+        # The file is (re)opened lazily, so a failed open or write only costs that batch; the loop
+        # keeps draining and the next batch retries.
+        event_file: TextIO | None = None
+        # Consecutive failed batches; only the first of a streak is logged with its traceback.
+        failed_batches = 0
+        stopping = False
+        try:
+            while not stopping:
+                item = self._queue.get()
+                if item is None:
+                    break
+                lines = [self._format(item)]
+                deadline = time.monotonic() + self._FLUSH_INTERVAL_SECONDS
+                while len(lines) < self._BATCH_MAX_EVENTS:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    lines.append(self._format(item))
+                try:
+                    if event_file is None:
+                        event_file = self.path.open("a", encoding="utf-8", buffering=1 << 16)
+                    event_file.write("".join(lines))
+                    event_file.flush()
+                except OSError:
+                    if not failed_batches:
+                        LOGGER.exception("Failed to write %s trace event(s) to %s", len(lines), self.path)
+                    failed_batches += 1
+                    if event_file is not None:
+                        try:
+                            event_file.close()
+                        except OSError:
+                            pass
+                        event_file = None
+                    continue
+                if failed_batches:
+                    LOGGER.warning("Trace writes to %s recovered after %s failed batch(es)", self.path, failed_batches)
+                    failed_batches = 0
+        finally:
+            if event_file is not None:
+                event_file.close()
 
 
 class SharedStateStore:
     """SQLite-backed state for memory, action queue, and idempotency dedupe."""
 
+    _KNOWN_KEYS_MAX = 4096
+
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
+        # Writes share one connection and are serialized by _write_lock, which also guards the
+        # idempotency-key cache below. Reads use a read-only connection per thread (opened on first use, released
+        # when the thread exits) and take no lock: WAL lets them run alongside the writer, and
+        # sqlite3 releases the GIL while a statement steps.
+        self._write_lock = threading.Lock()
+        self._writer = self._open_connection(read_only=False)
+        self._local = threading.local()
+        # Recently seen idempotency keys (oldest first). Keys are never deleted from queued_actions,
+        # so a hit means the INSERT would only raise IntegrityError and can be skipped.
+        self._known_keys: dict[str, None] = {}
         self._initialize()
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.path)
-        connection.row_factory = sqlite3.Row
+    def _open_connection(self, *, read_only: bool) -> sqlite3.Connection:
+        # Every statement below is fixed SQL text, so the per-connection cache keeps them all prepared.
+        # Autocommit (isolation_level=None): single statements commit on their own, and the few
+        # multi-statement writes open an explicit BEGIN IMMEDIATE instead of sqlite3's implicit BEGIN.
+        if read_only:
+            connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=256,
+                isolation_level=None,
+            )
+        else:
+            connection = sqlite3.connect(
+                self.path, cached_statements=256, check_same_thread=False, isolation_level=None
+            )
+        # Per-connection settings: wait for a concurrent writer instead of raising "database is
+        # locked", and in WAL mode only fsync at checkpoints rather than on every commit.
+        connection.execute("PRAGMA busy_timeout=30000")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-20000")
+        connection.execute("PRAGMA mmap_size=268435456")
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "reader", None)
+        if connection is None:
+            connection = self._open_connection(read_only=True)
+            self._local.reader = connection
         return connection
 
     def _initialize(self) -> None:
-        with self._connect() as connection:
-            connection.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS memory (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    updated_at REAL NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS queued_actions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    worker TEXT NOT NULL,
-                    action_type TEXT NOT NULL,
-                    payload TEXT NOT NULL,
-                    idempotency_key TEXT NOT NULL UNIQUE,
-                    status TEXT NOT NULL DEFAULT 'queued',
-                    created_at REAL NOT NULL,
-                    updated_at REAL NOT NULL
-                );
-                """
-            )
+        connection = self._writer
+        with self._write_lock:
+            # WAL is persistent in the database file, so switching once lets readers and the writer
+            # proceed concurrently for every later connection.
+            connection.execute("PRAGMA journal_mode=WAL")
+            try:
+                connection.executescript(
+                    """
+                    BEGIN IMMEDIATE;
+
+                    CREATE TABLE IF NOT EXISTS memory (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        updated_at REAL NOT NULL
+                    );
+
+                    CREATE TABLE IF NOT EXISTS queued_actions (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        worker TEXT NOT NULL,
+                        action_type TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        idempotency_key TEXT NOT NULL UNIQUE,
+                        status TEXT NOT NULL DEFAULT 'queued',
+                        created_at REAL NOT NULL,
+                        updated_at REAL NOT NULL
+                    );
+
+                    -- Serves claim_actions' worker/status filter and its id ordering from one range scan.
+                    CREATE INDEX IF NOT EXISTS idx_qa_worker_status_id ON queued_actions(worker, status, id);
+
+                    COMMIT;
+                    """
+                )
+            except BaseException:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
 
     def set_memory(self, key: str, value: dict[str, Any]) -> None:
-        now = time.time()
-        with self._lock, self._connect() as connection:
-            connection.execute(
+        serialized = json.dumps(value, sort_keys=True)
+        # The conflict clause compares against the stored row, so rewriting an unchanged value leaves
+        # it (and updated_at) untouched, whichever connection or process wrote it last.
+        with self._write_lock:
+            self._writer.execute(
                 """
                 INSERT INTO memory (key, value, updated_at)
                 VALUES (?, ?, ?)
                 ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
+                WHERE memory.value IS NOT excluded.value
                 """,
-                (key, json.dumps(value, sort_keys=True), now),
+                (key, serialized, time.time()),
             )
 
     def get_memory(self, key: str, default: dict[str, Any] | None = None) -> dict[str, Any]:
-        with self._lock, self._connect() as connection:
-            row = connection.execute("SELECT value FROM memory WHERE key = ?", (key,)).fetchone()
+        row = self._reader().execute("SELECT value FROM memory WHERE key = ?", (key,)).fetchone()
         if not row:
             return default or {}
-        return json.loads(str(row["value"]))
+        return json.loads(row[0])
 
     def queue_action(
         self,
@@ -115,10 +269,22 @@ class SharedStateStore:
         payload: dict[str, Any],
         idempotency_key: str,
     ) -> bool:
+        return self.queue_action_raw(worker, action_type, json.dumps(payload, sort_keys=True), idempotency_key)
+
+    def queue_action_raw(
+        self,
+        worker: str,
+        action_type: str,
+        payload_json: str,
+        idempotency_key: str,
+    ) -> bool:
+        """Like queue_action, for callers holding an already serialized (sorted-key JSON) payload."""
         now = time.time()
-        with self._lock, self._connect() as connection:
+        with self._write_lock:
+            if idempotency_key in self._known_keys:
+                return False
             try:
-                connection.execute(
+                self._writer.execute(
                     """
                     INSERT INTO queued_actions
                     (worker, action_type, payload, idempotency_key, status, created_at, updated_at)
@@ -127,54 +293,80 @@ class SharedStateStore:
                     (
                         worker,
                         action_type,
-                        json.dumps(payload, sort_keys=True),
+                        payload_json,
                         idempotency_key,
                         now,
                         now,
                     ),
                 )
-                return True
+                created = True
             except sqlite3.IntegrityError:
-                return False
+                created = False
+            # Only remembered once the key is known to be in the table.
+            self._remember_key(idempotency_key)
+            return created
+
+    def _remember_key(self, idempotency_key: str) -> None:
+        # Caller holds self._write_lock.
+        if len(self._known_keys) >= self._KNOWN_KEYS_MAX:
+            del self._known_keys[next(iter(self._known_keys))]
+        self._known_keys[idempotency_key] = None
 
     def claim_actions(self, worker: str, limit: int = 10) -> list[dict[str, Any]]:
         now = time.time()
-        with self._lock, self._connect() as connection:
-            rows = connection.execute(
+        # Selecting and flipping the batch to 'processing' is one statement (SQLite 3.35+ RETURNING),
+        # so no other claimer can pick up the same rows in between.
+        with self._write_lock:
+            rows = self._writer.execute(
                 """
-                SELECT id, worker, action_type, payload, idempotency_key
-                FROM queued_actions
-                WHERE worker = ? AND status = 'queued'
-                ORDER BY id ASC
-                LIMIT ?
+                UPDATE queued_actions SET status = 'processing', updated_at = ?
+                WHERE id IN (
+                    SELECT id FROM queued_actions
+                    WHERE worker = ? AND status = 'queued'
+                    ORDER BY id ASC
+                    LIMIT ?
+                )
+                RETURNING id, worker, action_type, payload, idempotency_key
                 """,
-                (worker, limit),
+                (now, worker, limit),
             ).fetchall()
-            ids = [int(row["id"]) for row in rows]
-            if ids:
-                marks = ",".join("?" for _ in ids)
-                connection.execute(
-                    f"UPDATE queued_actions SET status = 'processing', updated_at = ? WHERE id IN ({marks})",
-                    (now, *ids),
-                )
+        # RETURNING does not promise an order; callers expect the oldest action first. Rows are
+        # plain tuples led by the unique id, so sorting them directly orders by id.
+        rows.sort()
         return [
             {
-                "id": int(row["id"]),
-                "worker": str(row["worker"]),
-                "action_type": str(row["action_type"]),
-                "payload": json.loads(str(row["payload"])),
-                "idempotency_key": str(row["idempotency_key"]),
+                "id": action_id,
+                "worker": action_worker,
+                "action_type": action_type,
+                "payload": json.loads(payload),
+                "idempotency_key": idempotency_key,
             }
-            for row in rows
+            for action_id, action_worker, action_type, payload, idempotency_key in rows
         ]
 
     def mark_action_status(self, action_id: int, status: str) -> None:
-        with self._lock, self._connect() as connection:
-            connection.execute(
+        with self._write_lock:
+            self._writer.execute(
                 "UPDATE queued_actions SET status = ?, updated_at = ? WHERE id = ?",
                 (status, time.time(), action_id),
             )
 
+    def mark_action_statuses(self, updates: list[tuple[int, str]]) -> None:
+        """Apply several (action_id, status) transitions in a single transaction."""
+        now = time.time()
+        connection = self._writer
+        with self._write_lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "UPDATE queued_actions SET status = ?, updated_at = ? WHERE id = ?",
+                    [(status, now, action_id) for action_id, status in updates],
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
 
 class CircuitBreaker:
     """Per-worker failure breaker with cooldown cycles."""
@@ -205,10 +397,32 @@ class CircuitBreaker:
 class Scheduler:
     """Coordinates concurrent workers and optional platform adapters."""
 
-    def __init__(self, config_path: Path, shutdown_event: threading.Event) -> None:
+    def __init__(
+        self,
+        config_path: Path,
+        shutdown_event: threading.Event,
+        config: dict[str, Any] | None = None,
+    ) -> None:
         self.shutdown_event = shutdown_event
-        self.raw_config = self._load_config(config_path)
+        # Callers that already parsed the config file (e.g. main) pass it in to avoid a second read.
+        self.raw_config = config if config is not None else self._load_config(config_path)
         self.config = self._parse_scheduler_config(self.raw_config)
+        for adapter in PLATFORM_ADAPTERS.values():
+            adapter.shutdown_event = shutdown_event
+            adapter.login_cache_seconds = self.config.interval_seconds + self.config.jitter_seconds
+        # Frozen at startup; when it is empty each cycle skips platform adapter handling entirely.
+        self._enabled_adapters = self._resolve_enabled_adapters(self.raw_config)
+        self._adapter_pool = ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(self._enabled_adapters))),
+            thread_name_prefix="adapter",
+        )
+        self._adapter_futures: dict[str, Future[None]] = {}
+        # Scheduler-owned generator for cycle jitter instead of the shared module-level Random.
+        self._rng = random.Random()
+        # Long-lived pool for the terminal/browser workers; the watchdog waits on their futures from
+        # the scheduler thread. Spare threads cover a runner still stuck after a watchdog timeout.
+        self._worker_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sched")
+        self._worker_futures: dict[str, Future[Any]] = {}
 
         self.state_store = SharedStateStore(Path("data/state.sqlite3"))
         self.event_tracer = EventTracer(Path("logs/events.jsonl"))
@@ -237,8 +451,7 @@ class Scheduler:
         }
 
     def _load_config(self, config_path: Path) -> dict[str, Any]:
-        with config_path.open("r", encoding="utf-8") as config_file:
-            config_data: dict[str, Any] = json.load(config_file)
+        config_data: dict[str, Any] = json.loads(config_path.read_bytes())
         return config_data
 
     def _parse_scheduler_config(self, config_data: dict[str, Any]) -> SchedulerConfig:
@@ -267,36 +480,88 @@ class Scheduler:
             breaker_cooldown_cycles=cooldown_cycles,
         )
 
-    def _run_platform_adapters(self) -> None:
-        platform_config = self.raw_config.get("platforms", {})
+    def _resolve_enabled_adapters(
+        self, config_data: dict[str, Any]
+    ) -> tuple[tuple[str, PlatformAdapter, dict[str, Any]], ...]:
+        platform_config = config_data.get("platforms", {})
+        enabled: list[tuple[str, PlatformAdapter, dict[str, Any]]] = []
+        disabled: list[str] = []
         for platform_name, adapter in PLATFORM_ADAPTERS.items():
-            enabled = bool(platform_config.get(platform_name, {}).get("enabled", False))
-            if not enabled:
+            platform_cfg = platform_config.get(platform_name, {})
+            if bool(platform_cfg.get("enabled", False)):
+                enabled.append((platform_name, adapter, platform_cfg))
+            else:
+                disabled.append(platform_name)
+        if disabled:
+            LOGGER.info("Platform adapters disabled by config: %s", ", ".join(disabled))
+        return tuple(enabled)
+
+    def _submit_platform_adapters(self) -> dict[Future[None], str]:
+        # Adapters pace themselves and keep separate session files, so they run side by side.
+        futures: dict[Future[None], str] = {}
+        for platform_name, adapter, platform_cfg in self._enabled_adapters:
+            if self.shutdown_event.is_set():
+                break
+            previous = self._adapter_futures.get(platform_name)
+            if previous is not None and not previous.done():
+                LOGGER.warning("Adapter '%s' still running from a previous cycle; skipping", platform_name)
                 continue
             LOGGER.info("Running adapter for '%s'", platform_name)
-            adapter.process_cycle(platform_config.get(platform_name, {}), dry_run=self.config.dry_run)
+            future = self._adapter_pool.submit(adapter.process_cycle, platform_cfg, dry_run=self.config.dry_run)
+            self._adapter_futures[platform_name] = future
+            futures[future] = platform_name
+        return futures
 
-    def _run_worker_with_watchdog(self, worker_name: str, runner: Any) -> None:
+    def _await_platform_adapters(self, futures: dict[Future[None], str]) -> None:
+        if not futures:
+            return
+        done, not_done = wait(futures, timeout=self.config.interval_seconds)
+        for future in not_done:
+            LOGGER.warning("Adapter '%s' still running after %ss", futures[future], self.config.interval_seconds)
+        for future in done:
+            exc = future.exception()
+            if exc is not None:
+                LOGGER.error("Adapter '%s' failed", futures[future], exc_info=exc)
+
+    def close(self) -> None:
+        """Release the worker and adapter thread pools and flush pending trace events."""
+        self._worker_pool.shutdown(wait=True, cancel_futures=True)
+        self._adapter_pool.shutdown(wait=True, cancel_futures=True)
+        self.event_tracer.close()
+
+    def _submit_worker(self, worker_name: str, runner: Any) -> Future[Any] | None:
         breaker = self._breakers[worker_name]
         if not breaker.can_run():
             LOGGER.warning("Worker '%s' skipped due to open circuit breaker", worker_name)
             self.event_tracer.emit("worker_skipped_breaker", worker=worker_name)
-            return
+            return None
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(runner)
-            try:
-                future.result(timeout=self.config.worker_timeout_seconds)
-                breaker.success()
-                self.event_tracer.emit("worker_success", worker=worker_name)
-            except TimeoutError:
-                breaker.fail()
-                self.event_tracer.emit("worker_timeout", worker=worker_name)
-                LOGGER.error("Worker '%s' exceeded watchdog timeout", worker_name)
-            except Exception as exc:  # noqa: BLE001
-                breaker.fail()
-                self.event_tracer.emit("worker_failure", worker=worker_name, error=str(exc))
-                LOGGER.exception("Worker '%s' failed", worker_name)
+        previous = self._worker_futures.get(worker_name)
+        if previous is not None and not previous.done():
+            # A runner that outlived its watchdog still holds a pool thread; do not stack another.
+            breaker.fail()
+            self.event_tracer.emit("worker_timeout", worker=worker_name)
+            LOGGER.error("Worker '%s' still running from a previous cycle; skipping", worker_name)
+            return None
+
+        future = self._worker_pool.submit(runner)
+        self._worker_futures[worker_name] = future
+        return future
+
+    def _await_worker(self, worker_name: str, future: Future[Any], deadline: float) -> None:
+        breaker = self._breakers[worker_name]
+        try:
+            future.result(timeout=max(deadline - time.monotonic(), 0))
+            breaker.success()
+            self.event_tracer.emit("worker_success", worker=worker_name)
+        except TimeoutError:
+            breaker.fail()
+            self.event_tracer.emit("worker_timeout", worker=worker_name)
+            LOGGER.error("Worker '%s' exceeded watchdog timeout", worker_name)
+        except Exception as exc:  # noqa: BLE001
+            breaker.fail()
+            self.event_tracer.emit("worker_failure", worker=worker_name, error=str(exc))
+            LOGGER.exception("Worker '%s' failed", worker_name)
 
     def run(self) -> None:
         """Run until shutdown event is set."""
@@ -309,42 +574,54 @@ class Scheduler:
 
         while not self.shutdown_event.is_set():
             cycle_started = time.monotonic()
-            cycle_jitter = random.uniform(0, self.config.jitter_seconds)
-            self.event_tracer.emit("cycle_started", jitter_seconds=cycle_jitter)
-
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = [
-                    executor.submit(
-                        self._run_worker_with_watchdog,
-                        "terminal",
-                        self.terminal_worker.run_cycle,
-                    ),
-                    executor.submit(
-                        self._run_worker_with_watchdog,
-                        "browser",
-                        self.browser_worker.run_cycle,
-                    ),
-                ]
-                for future in futures:
-                    try:
-                        future.result()
-                    except Exception:
-                        LOGGER.exception("Unexpected scheduler orchestration error")
-
-            try:
-                self._run_platform_adapters()
-            except Exception:
-                LOGGER.exception("Unhandled error during platform adapter processing")
+            # One wall-clock read per cycle; the completion timestamp is derived from it below.
+            cycle_ts = time.time()
+            cycle_jitter = self._rng.uniform(0, self.config.jitter_seconds)
+            self.event_tracer.emit("cycle_started", ts=cycle_ts, jitter_seconds=cycle_jitter)
+
+            # Workers and platform adapters are all started before anything is awaited, so a slow
+            # worker does not hold the adapters back (or vice versa). Both workers start together,
+            # so their watchdog deadlines are measured from here.
+            deadline = time.monotonic() + self.config.worker_timeout_seconds
+            submitted = [
+                (worker_name, self._submit_worker(worker_name, runner))
+                for worker_name, runner in (
+                    ("terminal", self.terminal_worker.run_cycle),
+                    ("browser", self.browser_worker.run_cycle),
+                )
+            ]
+            adapter_futures: dict[Future[None], str] = {}
+            if self._enabled_adapters:
+                try:
+                    adapter_futures = self._submit_platform_adapters()
+                except Exception:
+                    LOGGER.exception("Unhandled error during platform adapter processing")
+
+            for worker_name, future in submitted:
+                if future is None:
+                    continue
+                try:
+                    self._await_worker(worker_name, future, deadline)
+                except Exception:
+                    LOGGER.exception("Unexpected scheduler orchestration error")
+
+            if adapter_futures:
+                try:
+                    self._await_platform_adapters(adapter_futures)
+                except Exception:
+                    LOGGER.exception("Unhandled error during platform adapter processing")
 
             elapsed = time.monotonic() - cycle_started
             target_period = self.config.interval_seconds + cycle_jitter
             sleep_for = max(target_period - elapsed, 0)
             self.event_tracer.emit(
                 "cycle_completed",
+                ts=cycle_ts + elapsed,
                 elapsed_seconds=round(elapsed, 4),
                 sleep_seconds=round(sleep_for, 4),
             )
             LOGGER.info("Scheduler cycle completed in %.2fs; sleeping %.2fs", elapsed, sleep_for)
             self.shutdown_event.wait(timeout=sleep_for)
 
+        self.close()
         LOGGER.info("Scheduler shutdown acknowledged")
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import os
+import selectors
 import subprocess
 import time
 from typing import Any
@@ -11,6 +14,11 @@ from typing import Any
 LOGGER = logging.getLogger("agent_core.terminal_worker")
 
 
+def _command_key(command: tuple[str, ...]) -> str:
+    """Idempotency key for a command; stays SHA-256 so keys match rows already in the queue."""
+    return hashlib.sha256(" ".join(command).encode("utf-8")).hexdigest()
+
+
 class TerminalWorker:
     """Runs vetted local terminal actions each scheduler cycle."""
 
@@ -19,20 +27,29 @@ class TerminalWorker:
         "/usr/bin/printf",
     }
 
+    # The seeded action never changes, so its key and serialized payload are built once at import.
+    _DEFAULT_COMMAND = ("/bin/echo", "TerminalWorker action completed")
+    _DEFAULT_KEY = _command_key(_DEFAULT_COMMAND)
+    _DEFAULT_PAYLOAD_JSON = json.dumps({"command": list(_DEFAULT_COMMAND)}, sort_keys=True)
+
     def __init__(self, dry_run: bool, state_store: Any, event_tracer: Any) -> None:
         self.dry_run = dry_run
         self.state_store = state_store
         self.event_tracer = event_tracer
+        # Idempotency keys this worker has already submitted; re-queueing them could only be a no-op.
+        self._seeded: set[str] = set()
 
     def _seed_default_actions(self) -> None:
-        command = ["/bin/echo", "TerminalWorker action completed"]
-        key = hashlib.sha256(" ".join(command).encode("utf-8")).hexdigest()
-        created = self.state_store.queue_action(
+        key = self._DEFAULT_KEY
+        if key in self._seeded:
+            return
+        created = self.state_store.queue_action_raw(
             worker="terminal",
             action_type="command",
-            payload={"command": command},
+            payload_json=self._DEFAULT_PAYLOAD_JSON,
             idempotency_key=key,
         )
+        self._seeded.add(key)
         if created:
             self.event_tracer.emit("action_queued", worker="terminal", idempotency_key=key)
 
@@ -44,6 +61,7 @@ class TerminalWorker:
             raise ValueError(f"Executable not in allowlist: {executable}")
 
     def _execute_action(self, action: dict[str, Any]) -> None:
+        """Dry-run a single action; real commands go through _execute_actions."""
         payload = action["payload"]
         command = payload.get("command", [])
         self._vet_command(command)
@@ -52,24 +70,83 @@ class TerminalWorker:
             idempotency_key=action["idempotency_key"],
             command=command,
         )
-
-        if self.dry_run:
+        if LOGGER.isEnabledFor(logging.INFO):
             LOGGER.info("TerminalWorker dry-run: skipping %s", " ".join(command))
-            time.sleep(0.02)
-        else:
-            completed = subprocess.run(command, check=True, capture_output=True, text=True)
-            LOGGER.info("TerminalWorker output: %s", completed.stdout.strip())
-
+        time.sleep(0.02)
         self.event_tracer.emit("terminal_action_completed", idempotency_key=action["idempotency_key"])
 
+    def _execute_actions(self, actions: list[dict[str, Any]], updates: list[tuple[int, str]]) -> None:
+        """Run every action's command as a concurrent child process, driven from this one thread.
+
+        All vetted commands are started up front and their pipes drained through one selector, so
+        the cycle takes as long as the slowest command rather than the sum of them. Each action's
+        status is appended to `updates`; the first failure is re-raised once every child has exited.
+        """
+        failure: Exception | None = None
+        launched: list[tuple[dict[str, Any], list[str], subprocess.Popen[bytes], bytearray, bytearray]] = []
+        with selectors.DefaultSelector() as selector:
+            for action in actions:
+                command = action["payload"].get("command", [])
+                try:
+                    self._vet_command(command)
+                    self.event_tracer.emit(
+                        "terminal_action_started",
+                        idempotency_key=action["idempotency_key"],
+                        command=command,
+                    )
+                    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                except Exception as exc:
+                    updates.append((action["id"], "failed"))
+                    failure = failure or exc
+                    continue
+                stdout, stderr = bytearray(), bytearray()
+                selector.register(process.stdout, selectors.EVENT_READ, stdout)
+                selector.register(process.stderr, selectors.EVENT_READ, stderr)
+                launched.append((action, command, process, stdout, stderr))
+
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, 1 << 16)
+                    if chunk:
+                        key.data.extend(chunk)
+                    else:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+
+        for action, command, process, stdout, stderr in launched:
+            returncode = process.wait()
+            if returncode != 0:
+                updates.append((action["id"], "failed"))
+                failure = failure or subprocess.CalledProcessError(
+                    returncode, command, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+                )
+                continue
+            # Decoding the child's output is only needed for this message.
+            if LOGGER.isEnabledFor(logging.INFO):
+                LOGGER.info("TerminalWorker output: %s", stdout.decode(errors="replace").strip())
+            self.event_tracer.emit("terminal_action_completed", idempotency_key=action["idempotency_key"])
+            updates.append((action["id"], "done"))
+
+        if failure is not None:
+            raise failure
+
     def run_cycle(self) -> None:
         self._seed_default_actions()
         queued_actions = self.state_store.claim_actions(worker="terminal", limit=10)
         LOGGER.info("TerminalWorker claimed %s action(s)", len(queued_actions))
-        for action in queued_actions:
-            try:
-                self._execute_action(action)
-                self.state_store.mark_action_status(action["id"], "done")
-            except Exception:
-                self.state_store.mark_action_status(action["id"], "failed")
-                raise
+        # Status updates are flushed in one batch at the end of the cycle, including on failure.
+        updates: list[tuple[int, str]] = []
+        try:
+            if not self.dry_run:
+                self._execute_actions(queued_actions, updates)
+                return
+            for action in queued_actions:
+                try:
+                    self._execute_action(action)
+                except Exception:
+                    updates.append((action["id"], "failed"))
+                    raise
+                updates.append((action["id"], "done"))
+        finally:
+            if updates:
+                self.state_store.mark_action_statuses(updates)